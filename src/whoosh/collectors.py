@@ -81,7 +81,7 @@ from abc import abstractmethod
 from array import array
 from bisect import insort
 from collections import defaultdict
-from heapq import heapify, heappush, heapreplace
+from heapq import heapify, heappush, heapreplace, nlargest, nsmallest
 
 from whoosh import sorting
 from whoosh.searching import Results, TimeLimit
@@ -577,9 +577,17 @@ class SortingCollector(Collector):
 
     def results(self):
         items = self.items
-        items.sort(reverse=self.reverse)
-        if self.limit:
-            items = items[: self.limit]
+        limit = self.limit
+        if limit and limit < len(items):
+            # Only the first "limit" items are returned, so select them with a
+            # bounded heap instead of sorting every collected item. Document
+            # numbers are unique, so there are no ties to keep stable
+            if self.reverse:
+                items = nlargest(limit, items)
+            else:
+                items = nsmallest(limit, items)
+        else:
+            items.sort(reverse=self.reverse)
         return self._results(items, docset=self.docset)
 
 
@@ -630,11 +630,11 @@ class NumericColumn(FixedBytesColumn):
             self._basepos = basepos
             self._doccount = doccount
             self._default = default
-            self._reverse = False
 
             self._typecode = typecode
             self._unpack = struct.Struct("!" + typecode).unpack
             self._defaultbytes = struct.pack("!" + typecode, default)
+            self._defaultvalue = self._unpack(self._defaultbytes)[0]
             self._fixedlen = struct.calcsize(typecode)
             self._count = length // self._fixedlen
 
@@ -642,14 +642,18 @@ class NumericColumn(FixedBytesColumn):
             return "<Numeric.Reader>"
 
         def __getitem__(self, docnum):
-            s = FixedBytesColumn.Reader.__getitem__(self, docnum)
+            # Sorting calls this for every matching document, so read and
+            # unpack the bytes directly instead of going through the
+            # FixedBytesColumn reader
+            if docnum >= self._count:
+                return self._defaultvalue
+            fixedlen = self._fixedlen
+            s = self._dbfile.get(self._basepos + fixedlen * docnum, fixedlen)
             return self._unpack(s)[0]
 
-        def sort_key(self, docnum):
-            key = self[docnum]
-            if self._reverse:
-                key = 0 - key
-            return key
+        def _reversed_sort_key(self, docnum):
+            # Subtract from 0 to reverse the order
+            return 0 - self[docnum]
 
         def load(self):
             if self._typecode in "qQ":
@@ -658,7 +662,9 @@ class NumericColumn(FixedBytesColumn):
                 return array(self._typecode, self)
 
         def set_reverse(self):
-            self._reverse = True
+            # Replace sort_key with the negating version instead of checking a
+            # reverse flag every time a key is requested
+            self.sort_key = self._reversed_sort_key
 
 
 # Column of boolean values
@@ -686,11 +686,28 @@ class NUMERIC(FieldType):
             return
 
         # word, freq, weight, valuestring
-        if self.shift_step:
+        if not self.shift_step:
+            yield (self.to_bytes(num), 1, 1.0, emptybytes)
+        elif isinstance(num, bytes) or num is None or not self._packs_sortable():
             for shift in range(0, self.bits, self.shift_step):
                 yield (self.to_bytes(num, shift), 1, 1.0, emptybytes)
         else:
-            yield (self.to_bytes(num), 1, 1.0, emptybytes)
+            # Convert the number to its sortable representation once, then
+            # just shift and pack it for each tier
+            x = self.prepare_number(num)
+            x = to_sortable(self.numtype, self.bits, self.signed, x)
+            pack = self._struct.pack
+            for shift in range(0, self.bits, self.shift_step):
+                yield (pack_byte(shift) + pack(x >> shift), 1, 1.0, emptybytes)
+
+    def _packs_sortable(self):
+        # index() packs the shifted sortable number itself, which is only the
+        # same as calling to_bytes() if a subclass hasn't changed the encoding
+        cls = type(self)
+        return (
+            cls.to_bytes is NUMERIC.to_bytes
+            and cls.sortable_to_bytes is NUMERIC.sortable_to_bytes
+        )
 
     def prepare_number(self, x):
         if x == emptybytes or x is None:
@@ -859,6 +876,21 @@ class DATETIME(NUMERIC):
     def from_column_value(self, x):
         return long_to_datetime(x)
 
+    def _packs_sortable(self):
+        # DATETIME.to_bytes() only converts the datetime before encoding it
+        # the same way as NUMERIC
+        cls = type(self)
+        return (
+            cls.to_bytes is DATETIME.to_bytes
+            and cls.sortable_to_bytes is NUMERIC.sortable_to_bytes
+        )
+
+    def index(self, num, **kwargs):
+        if not isinstance(num, (list, tuple)) and self._packs_sortable():
+            # Let NUMERIC.index() pack the converted number directly
+            num = self.prepare_datetime(num)
+        return NUMERIC.index(self, num, **kwargs)
+
     def to_bytes(self, x, shift=0):
         x = self.prepare_datetime(x)
         return NUMERIC.to_bytes(self, x, shift=shift)
@@ -968,22 +1000,25 @@ class BOOLEAN(FieldType):
         return x
 
     def to_bytes(self, x):
-        if isinstance(x, bytes):
+        # Bools are ints, so they can index the bytestrings tuple directly
+        if x.__class__ is bool:
+            return self.bytestrings[x]
+        elif isinstance(x, bytes):
             return x
         elif isinstance(x, str):
             x = x.lower() in self.trues
         else:
             x = bool(x)
-        bs = self.bytestrings[int(x)]
-        return bs
+        return self.bytestrings[x]
 
     def index(self, bit, **kwargs):
-        if isinstance(bit, str):
-            bit = bit.lower() in self.trues
-        else:
-            bit = bool(bit)
+        if bit.__class__ is not bool:
+            if isinstance(bit, str):
+                bit = bit.lower() in self.trues
+            else:
+                bit = bool(bit)
         # word, freq, weight, valuestring
-        return [(self.bytestrings[int(bit)], 1, 1.0, emptybytes)]
+        return [(self.bytestrings[bit], 1, 1.0, emptybytes)]
 
     def self_parsing(self):
         return True
@@ -1634,7 +1669,11 @@ class SchemaClass(Schema, metaclass=MetaSchema):
 
     def __new__(cls, *args, **kwargs):
         obj = super(Schema, cls).__new__(Schema)
-        kw = getattr(cls, "_clsfields", {})
+        # The metaclass merges the declared fields of the class and its bases
+        # once when the class is created, so there's no need to walk the MRO
+        # here. Copy the merged dict so extra keyword fields don't leak into
+        # the class.
+        kw = dict(getattr(cls, "_clsfields", {}))
         kw.update(kwargs)
         obj.__init__(*args, **kw)
         return obj
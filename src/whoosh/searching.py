@@ -1086,6 +1086,40 @@ class Results:
 
         return self.searcher.stored_fields(self.top_n[n][1])
 
+    def field_column(self, fieldname):
+        """Returns a list of the values of the given field for the scored
+        documents, in ranked order. This is the same as
+        ``[hit[fieldname] for hit in results]`` but doesn't create a
+        :class:`Hit` object for every document.
+
+        >>> r = searcher.search(query.Term("content", "render"))
+        >>> r.field_column("title")
+        ["Rendering the scene", "Rendering shadows"]
+
+        As with :class:`Hit`, if a document doesn't have a stored value for
+        the field, the value is read from the field's column instead.
+
+        :param fieldname: the name of the field to get the values of.
+        :raises KeyError: if a document has no stored value for the field and
+            the field has no column.
+        """
+
+        stored_fields = self.searcher.stored_fields
+        colreader = None
+        values = []
+        for _, docnum in self.top_n:
+            fields = stored_fields(docnum)
+            if fieldname in fields:
+                values.append(fields[fieldname])
+            else:
+                if colreader is None:
+                    reader = self.searcher.reader()
+                    if not reader.has_column(fieldname):
+                        raise KeyError(fieldname)
+                    colreader = reader.column_reader(fieldname)
+                values.append(colreader[docnum])
+        return values
+
     def facet_names(self):
         """Returns the available facet names, for use with the ``groups()``
         method.
@@ -1322,6 +1356,19 @@ class Results:
 
         return expander.expanded_terms(numterms, normalize=normalize)
 
+    def _partition(self, docset):
+        # Splits top_n in a single pass into the hits whose document numbers
+        # are in the given set and the hits whose document numbers aren't,
+        # keeping the relative order of each
+        arein = []
+        notin = []
+        for item in self.top_n:
+            if item[1] in docset:
+                arein.append(item)
+            else:
+                notin.append(item)
+        return arein, notin
+
     def extend(self, results):
         """Appends hits from 'results' (that are not already in this
         results object) to the end of these results.
@@ -1330,9 +1377,7 @@ class Results:
         """
 
         docs = self.docs()
-        for item in results.top_n:
-            if item[1] not in docs:
-                self.top_n.append(item)
+        self.top_n.extend([item for item in results.top_n if item[1] not in docs])
         self.docset = docs | results.docs()
         self._total = len(self.docset)
 
@@ -1362,8 +1407,7 @@ class Results:
             return
 
         otherdocs = results.docs()
-        arein = [item for item in self.top_n if item[1] in otherdocs]
-        notin = [item for item in self.top_n if item[1] not in otherdocs]
+        arein, notin = self._partition(otherdocs)
 
         if reverse:
             items = notin + arein
@@ -1386,8 +1430,7 @@ class Results:
         docs = self.docs()
         otherdocs = results.docs()
 
-        arein = [item for item in self.top_n if item[1] in otherdocs]
-        notin = [item for item in self.top_n if item[1] not in otherdocs]
+        arein, notin = self._partition(otherdocs)
         other = [item for item in results.top_n if item[1] not in docs]
 
         self.docset = docs | otherdocs
@@ -215,21 +215,36 @@ class ColumnCategorizer(Categorizer):
         self._column_type = self._fieldobj.column_type
         self._reverse = reverse
 
-        # The column reader is set in set_searcher() as we iterate over the
-        # sub-searchers
+        # The column reader and its bound sort_key method are set up after
+        # set_searcher() as we iterate over the sub-searchers
+        self._segment_reader = None
         self._creader = None
+        self._sort_key = None
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self._fieldobj!r}, {self._fieldname!r}, reverse={self._reverse!r})"
 
     def set_searcher(self, segment_searcher, docoffset):
-        r = segment_searcher.reader()
-        self._creader = r.column_reader(
+        # Don't open the segment's column until a document in the segment
+        # actually needs a key, since the query may not match anything in it
+        self._segment_reader = segment_searcher.reader()
+        self._creader = None
+        self._sort_key = self._first_sort_key
+
+    def _open_column(self):
+        self._creader = self._segment_reader.column_reader(
             self._fieldname, reverse=self._reverse, translate=False
         )
+        # key_for() is called for every matching document, so look up the
+        # method once per segment
+        self._sort_key = self._creader.sort_key
+        return self._creader
+
+    def _first_sort_key(self, segment_docnum):
+        return self._open_column().sort_key(segment_docnum)
 
     def key_for(self, matcher, segment_docnum):
-        return self._creader.sort_key(segment_docnum)
+        return self._sort_key(segment_docnum)
 
     def key_to_name(self, key):
         return self._fieldobj.from_column_value(key)
@@ -248,12 +263,16 @@ class ReversedColumnCategorizer(ColumnCategorizer):
 
         global_creader = reader.column_reader(fieldname, translate=False)
         self._values = sorted(set(global_creader))
+        # Map each value to its position in the sorted list, subtracted from
+        # 0 to reverse the order, so key_for is a dictionary lookup instead of
+        # a linear search through the values
+        self._orders = {value: 0 - i for i, value in enumerate(self._values)}
 
     def key_for(self, matcher, segment_docnum):
-        value = self._creader[segment_docnum]
-        order = self._values.index(value)
-        # Subtract from 0 to reverse the order
-        return 0 - order
+        creader = self._creader
+        if creader is None:
+            creader = self._open_column()
+        return self._orders[creader[segment_docnum]]
 
     def key_to_name(self, key):
         # Re-reverse the key to get the index into _values
@@ -829,6 +848,9 @@ class MultiFacet(FacetType):
     class MultiCategorizer(Categorizer):
         def __init__(self, catters):
             self.catters = catters
+            # Combining the keys is done for every matching document, so look
+            # up the sub-categorizers' key_for methods only once
+            self._keyfns = [catter.key_for for catter in catters]
 
         @property
         def needs_current(self):
@@ -839,7 +861,7 @@ class MultiFacet(FacetType):
                 catter.set_searcher(segment_searcher, docoffset)
 
         def key_for(self, matcher, docid):
-            return tuple(catter.key_for(matcher, docid) for catter in self.catters)
+            return tuple([keyfn(matcher, docid) for keyfn in self._keyfns])
 
         def key_to_name(self, key):
             return tuple(
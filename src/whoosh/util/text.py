@@ -31,8 +31,10 @@ import codecs
 import re
 from typing import TYPE_CHECKING, TypeVar
 
+from whoosh.util.varints import varint, varint_to_int
+
 if TYPE_CHECKING:
-    from collections.abc import Generator, Sequence
+    from collections.abc import Generator, Iterable, Sequence
 
 # Note: these functions return a tuple of (text, length), so when you call
 # them, you have to add [0] on the end, e.g. str = utf8encode(unicode)[0]
@@ -54,41 +56,61 @@ _T = TypeVar("_T")
 def first_diff(a: Sequence[_T], b: Sequence[_T]) -> int:
     """
     Returns the position of the first differing character in the sequences a
-    and b. For example, first_diff('render', 'rending') == 4. This function
-    limits the return value to 255 so the difference can be encoded in a single
-    byte.
+    and b. For example, first_diff('render', 'rending') == 4.
     """
 
+    n = min(len(a), len(b))
     i = 0
-    while i <= 255 and i < len(a) and i < len(b) and a[i] == b[i]:
+    while i < n and a[i] == b[i]:
         i += 1
     return i
 
 
 def prefix_encode(a: bytes, b: bytes) -> bytes:
     """
-    Compresses bytestring b as a byte representing the prefix it shares with a,
-    followed by the suffix bytes.
+    Compresses bytestring b as a varint representing the length of the prefix
+    it shares with a, followed by the suffix bytes.
     """
 
+    # Fast path for strings that don't share any prefix
+    if not a or not b or a[0] != b[0]:
+        return b"\x00" + b
     i = first_diff(a, b)
-    return byte(i) + b[i:]
+    return varint(i) + b[i:]
 
 
 def prefix_encode_all(ls: Sequence[str]) -> Generator[str]:
     """Compresses the given list of (unicode) strings by storing each string
-    (except the first one) as an integer (encoded in a byte) representing
-    the prefix it shares with its predecessor, followed by the suffix encoded
-    as UTF-8.
+    (except the first one) as an integer (encoded in a character) representing
+    the prefix it shares with its predecessor, followed by the suffix.
     """
 
     last = ""
     for w in ls:
-        i = first_diff(last, w)
-        yield chr(i) + w[i:]
+        if not last or not w or last[0] != w[0]:
+            yield "\x00" + w
+        else:
+            i = first_diff(last, w)
+            yield chr(i) + w[i:]
         last = w
 
 
+def prefix_encode_all_bytes(ls: Iterable[bytes]) -> list[bytes]:
+    """Compresses the given sequence of bytestrings using prefix_encode() and
+    returns the results as a list, which prefix_decode_all_bytes() can
+    decompress. This is faster than a generator when the caller needs all the
+    encoded strings at once anyway.
+    """
+
+    out = []
+    append = out.append
+    last = b""
+    for w in ls:
+        append(prefix_encode(last, w))
+        last = w
+    return out
+
+
 def prefix_decode_all(ls: Sequence[str]):
     """Decompresses a list of strings compressed by prefix_encode()."""
 
@@ -100,9 +122,30 @@ def prefix_decode_all(ls: Sequence[str]):
         last = decoded
 
 
+def prefix_decode_all_bytes(ls: Iterable[bytes]) -> Generator[bytes]:
+    """Decompresses a sequence of bytestrings compressed by prefix_encode().
+
+    This reuses a single ``bytearray`` buffer for the decoded term instead of
+    building a new string from slices for every item.
+    """
+
+    last = bytearray()
+    for w in ls:
+        i = w[0]
+        p = 1
+        if i & 0x80:
+            # The prefix length didn't fit in a single byte
+            i = varint_to_int(w)
+            p = len(varint(i))
+        del last[i:]
+        last += w[p:]
+        yield bytes(last)
+
+
 # Natural key sorting function
 
 _nkre = re.compile(r"\D+|\d+", re.UNICODE)
+_nkdigits = frozenset("0123456789")
 
 
 def _nkconv(i: str) -> str | int:
@@ -122,12 +165,51 @@ def natural_key(s: str) -> tuple[str | int, ...]:
     :rtype: tuple
     """
 
+    # Most strings have no digits at all, in which case the key is just the
+    # lowercased string and we can skip the regular expression
+    if s and s.isascii() and _nkdigits.isdisjoint(s):
+        return (s.lower(),)
+
     # Use _nkre to split the input string into a sequence of
     # digit runs and non-digit runs. Then use _nkconv() to convert
     # the digit runs into ints and the non-digit runs to lowercase.
     return tuple(_nkconv(m) for m in _nkre.findall(s))
 
 
+def natural_key_bytes(s: str) -> bytes:
+    """Like :func:`natural_key`, but returns a single flat bytestring instead
+    of a tuple, so comparing and hashing keys is a single operation over
+    contiguous memory. This is useful when the key is used for large sorts or
+    as a dictionary key.
+
+    Each digit run is encoded as a tag byte, the byte length of the integer
+    and its big-endian bytes, and each non-digit run as a (higher) tag byte
+    followed by the lowercased UTF-8 text, so numbers sort before letters.
+    Lengths under 255 take a single byte; longer lengths are written as
+    ``\xff``, a byte holding the size of the length, and the big-endian
+    length, which keeps arbitrarily wide integers in numeric order.
+
+    :param s: the str/unicode string to convert.
+    :rtype: bytes
+    """
+
+    parts = []
+    for m in _nkre.findall(s):
+        # \d matches decimal characters, which isdigit() is broader than
+        if m[0].isdecimal():
+            v = int(m)
+            n = max(1, (v.bit_length() + 7) // 8)
+            if n < 255:
+                length = byte(n)
+            else:
+                nn = (n.bit_length() + 7) // 8
+                length = b"\xff" + byte(nn) + n.to_bytes(nn, "big")
+            parts.append(b"\x01" + length + v.to_bytes(n, "big"))
+        else:
+            parts.append(b"\x02" + m.lower().encode("utf-8"))
+    return b"\x00".join(parts)
+
+
 # Regular expression functions
 
 
@@ -410,6 +410,23 @@ class IndexWriter:
 
         raise NotImplementedError
 
+    def add_documents(self, docs):
+        """Adds each document in the given iterable of dictionaries, where each
+        dictionary maps field names to values as in :meth:`add_document`::
+
+            w = myindex.writer()
+            w.add_documents({"id": str(i), "num": i} for i in range(400))
+            w.commit()
+
+        This is a convenience for adding many documents with the same writer
+        without the overhead of calling the method through the writer for each
+        document.
+        """
+
+        add = self.add_document
+        for fields in docs:
+            add(**fields)
+
     @abstractmethod
     def add_reader(self, reader):
         raise NotImplementedError
@@ -774,14 +791,16 @@ class SegmentWriter(IndexWriter):
                     # Ask the field to return a list of (text, weight, vbytes)
                     # tuples
                     items = field.index(value)
-                    # Only store the length if the field is marked scorable
-                    scorable = field.scorable
                     # Add the terms to the pool
                     for tbytes, freq, weight, vbytes in items:
-                        weight *= fieldboost
-                        if scorable:
-                            length += freq
-                        add_post((fieldname, tbytes, docnum, weight, vbytes))
+                        length += freq
+                        add_post(
+                            (fieldname, tbytes, docnum, weight * fieldboost, vbytes)
+                        )
+                    # Only store the length if the field is marked scorable
+                    # (checked once here instead of for every posting)
+                    if not field.scorable:
+                        length = 0
 
                 if field.separate_spelling():
                     spellfield = field.spelling_fieldname(fieldname)
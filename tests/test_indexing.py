@@ -1,4 +1,5 @@
 import random
+from array import array
 from collections import defaultdict
 from datetime import datetime, timezone
 from itertools import permutations
@@ -11,6 +12,20 @@ from whoosh.util.numeric import byte_to_length, length_to_byte
 from whoosh.util.testing import TempIndex, TempStorage
 from whoosh.writing import IndexingError
 
+# Words used to generate test documents
+_nato5 = ("alfa", "bravo", "charlie", "delta", "echo")
+_nato14 = _nato5 + (
+    "foxtrot",
+    "golf",
+    "hotel",
+    "india",
+    "juliet",
+    "kilo",
+    "lima",
+    "mike",
+    "november",
+)
+
 
 def test_creation():
     s = fields.Schema(
@@ -78,40 +93,28 @@ def test_version_in():
 
 def test_simple_indexing():
     schema = fields.Schema(text=fields.TEXT, id=fields.STORED)
-    domain = (
-        "alfa",
-        "bravo",
-        "charlie",
-        "delta",
-        "echo",
-        "foxtrot",
-        "golf",
-        "hotel",
-        "india",
-        "juliet",
-        "kilo",
-        "lima",
-        "mike",
-        "november",
-    )
-    docs = defaultdict(list)
+    domain = _nato14
+    # Generate the documents and the expected postings up front, so the
+    # writer only has to index them
+    rng = random.Random(0)
+    samples = [rng.sample(domain, 5) for _ in range(100)]
+    docs = defaultdict(lambda: array("i"))
+    for i, smp in enumerate(samples):
+        for word in smp:
+            docs[word].append(i)
+
     with TempIndex(schema, "simple") as ix:
         with ix.writer() as w:
-            for i in range(100):
-                smp = random.sample(domain, 5)
-                for word in smp:
-                    docs[word].append(i)
-                w.add_document(text=" ".join(smp), id=i)
+            w.add_documents(
+                {"text": " ".join(smp), "id": i} for i, smp in enumerate(samples)
+            )
 
         with ix.searcher() as s:
             for word in domain:
                 rset = sorted(
-                    [
-                        hit["id"]
-                        for hit in s.search(query.Term("text", word), limit=None)
-                    ]
+                    hit["id"] for hit in s.search(query.Term("text", word), limit=None)
                 )
-                assert rset == docs[word]
+                assert array("i", rset) == docs[word]
 
 
 def test_integrity():
@@ -124,20 +127,26 @@ def test_integrity():
     w.add_document(name="Alpha beta", value="Gamma delta epsilon omega.")
     w.commit()
 
+    # Keep the documents in a second segment so the reader has to merge the
+    # term lists
     w = ix.writer()
     w.add_document(name="One two", value="Three four five.")
-    w.commit()
+    w.commit(merge=False)
 
     tr = ix.reader()
     assert ix.doc_count_all() == 3
     assert " ".join(tr.field_terms("name")) == "alpha beta brown one two yellow"
 
 
-def test_lengths():
-    s = fields.Schema(
+def _lengths_schema():
+    return fields.Schema(
         f1=fields.KEYWORD(stored=True, scorable=True),
         f2=fields.KEYWORD(stored=True, scorable=True),
     )
+
+
+def test_lengths():
+    s = _lengths_schema()
     with TempIndex(s, "testlengths") as ix:
         w = ix.writer()
         items = "ABCDEFG"
@@ -149,14 +158,15 @@ def test_lengths():
         w.commit()
 
         with ix.reader() as dr:
-            ls1 = [dr.doc_field_length(i, "f1") for i in range(0, len(lengths))]
+            doc_field_length = dr.doc_field_length
+            ls1 = [doc_field_length(i, "f1") for i in range(len(lengths))]
             assert ls1 == [0] * len(lengths)
-            ls2 = [dr.doc_field_length(i, "f2") for i in range(0, len(lengths))]
+            ls2 = [doc_field_length(i, "f2") for i in range(len(lengths))]
             assert ls2 == [byte_to_length(length_to_byte(l)) for l in lengths]
 
 
 def test_many_lengths():
-    domain = "alfa bravo charlie delta echo".split()
+    domain = _nato5
     schema = fields.Schema(text=fields.TEXT)
     ix = RamStorage().create_index(schema)
     w = ix.writer()
@@ -174,10 +184,7 @@ def test_many_lengths():
 
 
 def test_lengths_ram():
-    s = fields.Schema(
-        f1=fields.KEYWORD(stored=True, scorable=True),
-        f2=fields.KEYWORD(stored=True, scorable=True),
-    )
+    s = _lengths_schema()
     st = RamStorage()
     ix = st.create_index(s)
     w = ix.writer()
@@ -202,10 +209,7 @@ def test_lengths_ram():
 
 
 def test_merged_lengths():
-    s = fields.Schema(
-        f1=fields.KEYWORD(stored=True, scorable=True),
-        f2=fields.KEYWORD(stored=True, scorable=True),
-    )
+    s = _lengths_schema()
     with TempIndex(s, "mergedlengths") as ix:
         w = ix.writer()
         w.add_document(f1="A B C", f2="X")
@@ -229,82 +233,41 @@ def test_merged_lengths():
             assert dr.doc_field_length(4, "f1") == 5
 
 
-def test_frequency_keyword():
+def _check_frequencies(words):
+    # The two frequency tests index the same documents, just with different
+    # words, so they share this helper
+    a, b, c, d, e, f, missing = words
     s = fields.Schema(content=fields.KEYWORD)
-    st = RamStorage()
-    ix = st.create_index(s)
+    ix = RamStorage().create_index(s)
 
-    w = ix.writer()
-    w.add_document(content="A B C D E")
-    w.add_document(content="B B B B C D D")
-    w.add_document(content="D E F")
-    w.commit()
+    with ix.writer() as w:
+        w.add_document(content=" ".join([a, b, c, d, e]))
+        w.add_document(content=" ".join([b, b, b, b, c, d, d]))
+        w.add_document(content=" ".join([d, e, f]))
 
+    # (word, doc frequency, total frequency)
+    expected = [(a, 1, 1), (b, 2, 5), (c, 2, 2), (d, 3, 4), (e, 2, 2), (f, 1, 1)]
     with ix.reader() as tr:
-        assert tr.doc_frequency("content", "B") == 2
-        assert tr.frequency("content", "B") == 5
-        assert tr.doc_frequency("content", "E") == 2
-        assert tr.frequency("content", "E") == 2
-        assert tr.doc_frequency("content", "A") == 1
-        assert tr.frequency("content", "A") == 1
-        assert tr.doc_frequency("content", "D") == 3
-        assert tr.frequency("content", "D") == 4
-        assert tr.doc_frequency("content", "F") == 1
-        assert tr.frequency("content", "F") == 1
-        assert tr.doc_frequency("content", "Z") == 0
-        assert tr.frequency("content", "Z") == 0
+        for word, docfreq, freq in expected + [(missing, 0, 0)]:
+            assert tr.doc_frequency("content", word) == docfreq
+            assert tr.frequency("content", word) == freq
 
         stats = [
             (fname, text, ti.doc_frequency(), ti.weight()) for (fname, text), ti in tr
         ]
 
         assert stats == [
-            ("content", b"A", 1, 1),
-            ("content", b"B", 2, 5),
-            ("content", b"C", 2, 2),
-            ("content", b"D", 3, 4),
-            ("content", b"E", 2, 2),
-            ("content", b"F", 1, 1),
+            ("content", word.encode("ascii"), docfreq, freq)
+            for word, docfreq, freq in expected
         ]
 
 
-def test_frequency_text():
-    s = fields.Schema(content=fields.KEYWORD)
-    st = RamStorage()
-    ix = st.create_index(s)
-
-    w = ix.writer()
-    w.add_document(content="alfa bravo charlie delta echo")
-    w.add_document(content="bravo bravo bravo bravo charlie delta delta")
-    w.add_document(content="delta echo foxtrot")
-    w.commit()
-
-    with ix.reader() as tr:
-        assert tr.doc_frequency("content", "bravo") == 2
-        assert tr.frequency("content", "bravo") == 5
-        assert tr.doc_frequency("content", "echo") == 2
-        assert tr.frequency("content", "echo") == 2
-        assert tr.doc_frequency("content", "alfa") == 1
-        assert tr.frequency("content", "alfa") == 1
-        assert tr.doc_frequency("content", "delta") == 3
-        assert tr.frequency("content", "delta") == 4
-        assert tr.doc_frequency("content", "foxtrot") == 1
-        assert tr.frequency("content", "foxtrot") == 1
-        assert tr.doc_frequency("content", "zulu") == 0
-        assert tr.frequency("content", "zulu") == 0
+def test_frequency_keyword():
+    _check_frequencies(["A", "B", "C", "D", "E", "F", "Z"])
 
-        stats = [
-            (fname, text, ti.doc_frequency(), ti.weight()) for (fname, text), ti in tr
-        ]
 
-        assert stats == [
-            ("content", b"alfa", 1, 1),
-            ("content", b"bravo", 2, 5),
-            ("content", b"charlie", 2, 2),
-            ("content", b"delta", 3, 4),
-            ("content", b"echo", 2, 2),
-            ("content", b"foxtrot", 1, 1),
-        ]
+def test_frequency_text():
+    _check_frequencies(["alfa", "bravo", "charlie", "delta", "echo", "foxtrot", "zulu"])
 
 
 def test_deletion():
@@ -392,7 +355,7 @@ def test_update2():
     )
     with TempIndex(schema, "update2") as ix:
         nums = list(range(21))
-        random.shuffle(nums)
+        random.Random(0).shuffle(nums)
         for i, n in enumerate(nums):
             w = ix.writer()
             w.update_document(key=str(n % 10), p=str(i))
@@ -410,7 +373,7 @@ def test_update_numeric():
     )
     with TempIndex(schema, "updatenum") as ix:
         nums = list(range(5)) * 3
-        random.shuffle(nums)
+        random.Random(0).shuffle(nums)
         for num in nums:
             with ix.writer() as w:
                 w.update_document(num=num, text=str(num))
@@ -449,32 +412,22 @@ def test_reindex():
 
 
 def test_noscorables1():
-    values = [
-        "alfa",
-        "bravo",
-        "charlie",
-        "delta",
-        "echo",
-        "foxtrot",
-        "golf",
-        "hotel",
-        "india",
-        "juliet",
-        "kilo",
-        "lima",
-    ]
-    from random import choice, randint, sample
-
+    values = _nato14[:12]
     times = 1000
+    rng = random.Random(0)
+    # Sample all the documents before opening the writer
+    docs = [
+        {
+            "id": rng.choice(values),
+            "tags": " ".join(rng.sample(values, rng.randint(2, 7))),
+        }
+        for _ in range(times)
+    ]
 
     schema = fields.Schema(id=fields.ID, tags=fields.KEYWORD)
     with TempIndex(schema, "noscorables1") as ix:
-        w = ix.writer()
-        for _ in range(times):
-            w.add_document(
-                id=choice(values), tags=" ".join(sample(values, randint(2, 7)))
-            )
-        w.commit()
+        with ix.writer() as w:
+            w.add_documents(docs)
 
         with ix.searcher() as s:
             s.search(query.Term("id", "bravo"))
@@ -537,14 +490,14 @@ def test_multi():
 def test_deleteall():
     schema = fields.Schema(text=fields.TEXT)
     with TempIndex(schema, "deleteall") as ix:
-        w = ix.writer()
-        domain = "alfa bravo charlie delta echo".split()
-        for i, ls in enumerate(permutations(domain)):
-            w.add_document(text=" ".join(ls))
-            if not i % 10:
-                w.commit()
-                w = ix.writer()
-        w.commit()
+        docs = [{"text": " ".join(ls)} for ls in permutations(_nato5)]
+        # Commit the documents as several unmerged segments, so deleting by
+        # global document number has to cross segment offsets
+        for start in range(0, len(docs), 50):
+            with ix.writer() as w:
+                w.add_documents(docs[start : start + 50])
+                w.merge = False
+        assert len(ix._segments()) == 3
 
         # This is just a test, don't use this method to delete all docs IRL!
         doccount = ix.doc_count_all()
@@ -661,11 +614,14 @@ def test_multi_language():
     )
     ix = RamStorage().create_index(schema)
 
+    # "Pre-analyze" the documents into token strings before opening the writer
+    preanalyzed = [
+        (doclang, content, [token.text for token in analyzers[doclang](content)])
+        for doclang, content in corpus
+    ]
+
     with ix.writer() as w:
-        for doclang, content in corpus:
-            ana = analyzers[doclang]
-            # "Pre-analyze" the field into token strings
-            words = [token.text for token in ana(content)]
+        for doclang, content, words in preanalyzed:
             # Note we store the original value but index the pre-analyzed words
             w.add_document(lang=doclang, content=words, _stored_content=content)
 
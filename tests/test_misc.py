@@ -5,6 +5,16 @@ import time
 from whoosh.util.filelock import try_for
 from whoosh.util.numeric import byte_to_length, length_to_byte
 from whoosh.util.testing import TempStorage
+from whoosh.util.text import (
+    first_diff,
+    natural_key,
+    natural_key_bytes,
+    prefix_decode_all,
+    prefix_decode_all_bytes,
+    prefix_encode,
+    prefix_encode_all,
+    prefix_encode_all_bytes,
+)
 
 
 def test_now():
@@ -133,3 +143,84 @@ def test_version_object():
 
     assert sv(1, 2, 3).to_int() == 17213488128
     assert sv.from_int(17213488128) == sv(1, 2, 3)
+
+
+def test_prefix_decode_bytes():
+    words = [b"alfa", b"alpha", b"alphabet", b"bravo", b"brave", b""]
+    encoded = []
+    last = b""
+    for w in words:
+        encoded.append(prefix_encode(last, w))
+        last = w
+    assert list(prefix_decode_all_bytes(encoded)) == words
+
+
+def test_first_diff():
+    assert first_diff("render", "rending") == 4
+    assert first_diff("", "abc") == 0
+    assert first_diff("abc", "abc") == 3
+    assert first_diff(b"a" * 300, b"a" * 300) == 300
+
+
+def test_natural_key_bytes():
+    names = ["name10", "Name5", "name", "name5b", "name5a", "b", "name300", "A"]
+    assert sorted(names, key=natural_key_bytes) == sorted(names, key=natural_key)
+    assert sorted(["a", "1", "B", "10"], key=natural_key_bytes) == [
+        "1",
+        "10",
+        "a",
+        "B",
+    ]
+    assert natural_key_bytes("Abc1") == natural_key_bytes("aBC1")
+
+    # Superscript two is a digit but not a decimal, so it's part of a text run
+    assert natural_key_bytes("\u00b2") == b"\x02\xc2\xb2"
+    assert sorted(["x2", "\u00b2", "x\u00b2"], key=natural_key_bytes) == sorted(
+        ["x2", "\u00b2", "x\u00b2"], key=natural_key
+    )
+
+    # Integers too wide for a single length byte still sort numerically
+    wide = ["a" + "9" * 700, "a" + "1" + "0" * 700, "a" + "9" * 614, "a5", "a"]
+    assert sorted(wide, key=natural_key_bytes) == sorted(wide, key=natural_key)
+
+
+def test_natural_key():
+    assert natural_key("") == ()
+    assert natural_key("Hello") == ("hello",)
+    assert natural_key("name10b") == ("name", 10, "b")
+    assert sorted(["a10", "a9", "B", "a"], key=natural_key) == ["a", "a9", "a10", "B"]
+
+
+def test_prefix_encode_all():
+    words = ["alfa", "alpha", "bravo", "", "charlie", "charles"]
+    encoded = list(prefix_encode_all(words))
+    assert encoded == [
+        "\x00alfa",
+        "\x02pha",
+        "\x00bravo",
+        "\x00",
+        "\x00charlie",
+        "\x05es",
+    ]
+    assert list(prefix_decode_all(encoded)) == words
+
+
+def test_prefix_encode_long():
+    a = b"x" * 300 + b"a"
+    b = b"x" * 300 + b"bc"
+    encoded = prefix_encode(a, b)
+    assert encoded == b"\xac\x02bc"
+    assert list(prefix_decode_all_bytes([prefix_encode(b"", a), encoded])) == [a, b]
+
+    words = ["y" * 400 + "a", "y" * 400 + "b"]
+    assert list(prefix_decode_all(prefix_encode_all(words))) == words
+
+
+def test_prefix_encode_all_bytes():
+    words = [b"alfa", b"alpha", b"bravo", b"", b"charlie", b"charles"]
+    encoded = prefix_encode_all_bytes(words)
+    last = b""
+    for w, e in zip(words, encoded):
+        assert e == prefix_encode(last, w)
+        last = w
+    assert list(prefix_decode_all_bytes(encoded)) == words
@@ -1,6 +1,8 @@
+import math
 import random
 from datetime import datetime, timedelta, timezone
-from itertools import permutations
+from itertools import permutations, product
+from operator import itemgetter
 
 from whoosh import columns, fields, query, sorting
 from whoosh.filedb.filestore import RamStorage
@@ -61,11 +63,25 @@ def make_single_index(ix):
 
 
 def make_multi_index(ix):
-    for i in range(0, len(docs), 3):
-        w = ix.writer()
-        for doc in docs[i : i + 3]:
-            w.add_document(ev="a", **doc)
-        w.commit(merge=False)
+    evdocs = [dict(doc, ev="a") for doc in docs]
+    commit_in_segments(ix, (evdocs[i : i + 3] for i in range(0, len(evdocs), 3)))
+
+
+def commit_in_segments(ix, batches):
+    # Commits each batch of documents as its own unmerged segment
+    for batch in batches:
+        with ix.writer() as w:
+            w.add_documents(batch)
+            w.merge = False
+
+
+def ram_index(schema, docs):
+    # Creates an in-memory index and commits the given field dictionaries to
+    # it as a single segment
+    ix = RamStorage().create_index(schema)
+    with ix.writer() as w:
+        w.add_documents(docs)
+    return ix
 
 
 def try_sort(sortedby, key, q=None, limit=None, reverse=False):
@@ -80,30 +96,30 @@ def try_sort(sortedby, key, q=None, limit=None, reverse=False):
         fn(ix)
         with ix.searcher() as s:
             r = s.search(q, sortedby=sortedby, limit=limit, reverse=reverse)
-            rids = [d["id"] for d in r]
+            rids = r.field_column("id")
             assert rids == correct
 
 
 def test_sortedby():
-    try_sort("id", lambda d: d["id"])
-    try_sort("id", lambda d: d["id"], limit=5)
-    try_sort("id", lambda d: d["id"], reverse=True)
-    try_sort("id", lambda d: d["id"], limit=5, reverse=True)
+    try_sort("id", itemgetter("id"))
+    try_sort("id", itemgetter("id"), limit=5)
+    try_sort("id", itemgetter("id"), reverse=True)
+    try_sort("id", itemgetter("id"), limit=5, reverse=True)
 
 
 def test_multisort():
     mf = sorting.MultiFacet(["tag", "id"])
-    try_sort(mf, lambda d: (d["tag"], d["id"]))
-    try_sort(mf, lambda d: (d["tag"], d["id"]), reverse=True)
-    try_sort(mf, lambda d: (d["tag"], d["id"]), limit=5)
-    try_sort(mf, lambda d: (d["tag"], d["id"]), reverse=True, limit=5)
+    try_sort(mf, itemgetter("tag", "id"))
+    try_sort(mf, itemgetter("tag", "id"), reverse=True)
+    try_sort(mf, itemgetter("tag", "id"), limit=5)
+    try_sort(mf, itemgetter("tag", "id"), reverse=True, limit=5)
 
 
 def test_numeric():
-    try_sort("num", lambda d: d["num"])
-    try_sort("num", lambda d: d["num"], reverse=True)
-    try_sort("num", lambda d: d["num"], limit=5)
-    try_sort("frac", lambda d: d["frac"])
+    try_sort("num", itemgetter("num"))
+    try_sort("num", itemgetter("num"), reverse=True)
+    try_sort("num", itemgetter("num"), limit=5)
+    try_sort("frac", itemgetter("frac"))
 
 
 def test_empty_field():
@@ -117,14 +133,14 @@ def test_empty_field():
 
         with ix.searcher() as s:
             r = s.search(query.Every(), sortedby="key")
-            assert [h["id"] for h in r] == [1, 2, 3]
+            assert r.field_column("id") == [1, 2, 3]
 
 
 def test_page_sorted():
     schema = fields.Schema(key=fields.ID(stored=True))
     with TempIndex(schema, "pagesorted") as ix:
         domain = list("abcdefghijklmnopqrstuvwxyz")
-        random.shuffle(domain)
+        random.Random(0).shuffle(domain)
 
         w = ix.writer()
         for char in domain:
@@ -164,22 +180,33 @@ def test_score_facet():
     with ix.searcher() as s:
         facet = sorting.MultiFacet(["b", sorting.ScoreFacet()])
         r = s.search(q=query.Term("a", "alfa"), sortedby=facet)
-        assert [h["id"] for h in r] == [6, 4, 5, 2, 1, 3]
+        assert r.field_column("id") == [6, 4, 5, 2, 1, 3]
 
 
-def test_function_facet():
+_vector_ix = None
+
+
+def get_vector_index():
+    # test_function_facet and test_sorting_function only read this index, so
+    # build it once for both
+    global _vector_ix
+
+    if _vector_ix is not None:
+        return _vector_ix
+
     schema = fields.Schema(id=fields.STORED, text=fields.TEXT(stored=True, vector=True))
-    ix = RamStorage().create_index(schema)
-    w = ix.writer()
+    _vector_ix = RamStorage().create_index(schema)
     domain = ("alfa", "bravo", "charlie")
-    count = 1
-    for w1 in domain:
-        for w2 in domain:
-            for w3 in domain:
-                for w4 in domain:
-                    w.add_document(id=count, text=" ".join((w1, w2, w3, w4)))
-                    count += 1
-    w.commit()
+    with _vector_ix.writer() as w:
+        add = w.add_document
+        for count, words in enumerate(product(domain, repeat=4), start=1):
+            add(id=count, text=" ".join(words))
+
+    return _vector_ix
+
+
+def test_function_facet():
+    ix = get_vector_index()
 
     def fn(searcher, docnum):
         v = dict(searcher.vector_as("frequency", docnum, "text"))
@@ -192,7 +219,7 @@ def test_function_facet():
 
         fnfacet = sorting.FunctionFacet(fn)
         r = s.search(q, sortedby=fnfacet)
-        texts = [hit["text"] for hit in r]
+        texts = r.field_column("text")
         for t in texts[:10]:
             tks = t.split()
             assert tks.count("alfa") == tks.count("bravo")
@@ -217,7 +244,7 @@ def test_numeric_field_facet():
     with ix.searcher() as s:
         mf = sorting.MultiFacet().add_field("v1").add_field("v2", reverse=True)
         r = s.search(query.Every(), sortedby=mf)
-        assert [hit["id"] for hit in r] == [6, 4, 2, 3, 1, 5]
+        assert r.field_column("id") == [6, 4, 2, 3, 1, 5]
 
 
 def test_query_facet():
@@ -233,9 +260,9 @@ def test_query_facet():
         q2 = query.TermRange("v", "d", "f")
         q3 = query.TermRange("v", "g", "i")
 
-        assert [hit["id"] for hit in s.search(q1)] == [1, 2, 4]
-        assert [hit["id"] for hit in s.search(q2)] == [5, 7, 8]
-        assert [hit["id"] for hit in s.search(q3)] == [0, 3, 6]
+        assert s.search(q1).field_column("id") == [1, 2, 4]
+        assert s.search(q2).field_column("id") == [5, 7, 8]
+        assert s.search(q3).field_column("id") == [0, 3, 6]
 
         facet = sorting.QueryFacet({"a-c": q1, "d-f": q2, "g-i": q3})
         r = s.search(query.Every(), groupedby=facet)
@@ -279,14 +306,16 @@ def test_query_facet_overlap():
 
 def test_missing_field_facet():
     schema = fields.Schema(id=fields.STORED, tag=fields.ID)
-    ix = RamStorage().create_index(schema)
-    w = ix.writer()
-    w.add_document(id=0, tag="alfa")
-    w.add_document(id=1, tag="alfa")
-    w.add_document(id=2)
-    w.add_document(id=3, tag="bravo")
-    w.add_document(id=4)
-    w.commit()
+    ix = ram_index(
+        schema,
+        [
+            {"id": 0, "tag": "alfa"},
+            {"id": 1, "tag": "alfa"},
+            {"id": 2},
+            {"id": 3, "tag": "bravo"},
+            {"id": 4},
+        ],
+    )
 
     with ix.searcher() as s:
         r = s.search(query.Every(), groupedby="tag")
@@ -295,14 +324,16 @@ def test_missing_field_facet():
 
 def test_missing_numeric_facet():
     schema = fields.Schema(id=fields.STORED, tag=fields.NUMERIC)
-    ix = RamStorage().create_index(schema)
-    w = ix.writer()
-    w.add_document(id=0, tag=1)
-    w.add_document(id=1, tag=1)
-    w.add_document(id=2)
-    w.add_document(id=3, tag=0)
-    w.add_document(id=4)
-    w.commit()
+    ix = ram_index(
+        schema,
+        [
+            {"id": 0, "tag": 1},
+            {"id": 1, "tag": 1},
+            {"id": 2},
+            {"id": 3, "tag": 0},
+            {"id": 4},
+        ],
+    )
 
     with ix.searcher() as s:
         r = s.search(query.Every(), groupedby="tag")
@@ -311,13 +342,16 @@ def test_missing_numeric_facet():
 
 def test_missing_overlap():
     schema = fields.Schema(a=fields.NUMERIC(stored=True), b=fields.KEYWORD(stored=True))
-    ix = RamStorage().create_index(schema)
-    with ix.writer() as w:
-        w.add_document(a=0, b="one two")
-        w.add_document(a=1)
-        w.add_document(a=2, b="two three")
-        w.add_document(a=3)
-        w.add_document(a=4, b="three four")
+    ix = ram_index(
+        schema,
+        [
+            {"a": 0, "b": "one two"},
+            {"a": 1},
+            {"a": 2, "b": "two three"},
+            {"a": 3},
+            {"a": 4, "b": "three four"},
+        ],
+    )
 
     with ix.searcher() as s:
         facet = sorting.FieldFacet("b", allow_overlap=True)
@@ -350,15 +384,17 @@ def test_date_facet():
 
 def test_range_facet():
     schema = fields.Schema(id=fields.STORED, price=fields.NUMERIC)
-    ix = RamStorage().create_index(schema)
-    w = ix.writer()
-    w.add_document(id=0, price=200)
-    w.add_document(id=1, price=100)
-    w.add_document(id=2)
-    w.add_document(id=3, price=50)
-    w.add_document(id=4, price=500)
-    w.add_document(id=5, price=125)
-    w.commit()
+    ix = ram_index(
+        schema,
+        [
+            {"id": 0, "price": 200},
+            {"id": 1, "price": 100},
+            {"id": 2},
+            {"id": 3, "price": 50},
+            {"id": 4, "price": 500},
+            {"id": 5, "price": 125},
+        ],
+    )
 
     with ix.searcher() as s:
         rf = sorting.RangeFacet("price", 0, 1000, 100)
@@ -374,11 +410,7 @@ def test_range_facet():
 
 def test_range_gaps():
     schema = fields.Schema(id=fields.STORED, num=fields.NUMERIC)
-    ix = RamStorage().create_index(schema)
-    w = ix.writer()
-    for i in range(10):
-        w.add_document(id=i, num=i)
-    w.commit()
+    ix = ram_index(schema, ({"id": i, "num": i} for i in range(10)))
 
     with ix.searcher() as s:
         rf = sorting.RangeFacet("num", 0, 1000, [1, 2, 3])
@@ -438,12 +470,11 @@ def test_relative_daterange():
     schema = fields.Schema(id=fields.STORED, date=fields.DATETIME)
     ix = RamStorage().create_index(schema)
     basedate = datetime(2001, 1, 1, tzinfo=timezone.utc)
-    count = 0
+    enddate = datetime(2001, 12, 1, tzinfo=timezone.utc)
+    step = timedelta(days=14, hours=16)
+    dates = [basedate + i * step for i in range(math.ceil((enddate - basedate) / step))]
     with ix.writer() as w:
-        while basedate < datetime(2001, 12, 1, tzinfo=timezone.utc):
-            w.add_document(id=count, date=basedate)
-            basedate += timedelta(days=14, hours=16)
-            count += 1
+        w.add_documents({"id": i, "date": date} for i, date in enumerate(dates))
 
     with ix.searcher() as s:
         gap = relativedelta(months=1)
@@ -622,25 +653,19 @@ def test_sort_filter():
     schema = fields.Schema(group=fields.ID(stored=True), key=fields.ID(stored=True))
     groups = "alfa bravo charlie".split()
     keys = "abcdefghijklmnopqrstuvwxyz"
-    source = []
-    for i in range(100):
-        key = keys[i % len(keys)]
-        group = groups[i % len(groups)]
-        source.append({"key": key, "group": group})
-    source.sort(key=lambda x: (x["key"], x["group"]))
+    source = sorted(
+        (
+            {"key": keys[i % len(keys)], "group": groups[i % len(groups)]}
+            for i in range(100)
+        ),
+        key=itemgetter("key", "group"),
+    )
 
     sample = list(source)
-    random.shuffle(sample)
+    random.Random(0).shuffle(sample)
 
     with TempIndex(schema, "sortfilter") as ix:
-        w = ix.writer()
-        for i, fs in enumerate(sample):
-            w.add_document(**fs)
-            i += 1
-            if not i % 26:
-                w.commit(merge=False)
-                w = ix.writer()
-        w.commit()
+        commit_in_segments(ix, (sample[i : i + 26] for i in range(0, len(sample), 26)))
 
         fq = query.Term("group", "bravo")
 
@@ -676,18 +701,7 @@ def test_sort_filter():
 
 
 def test_sorting_function():
-    schema = fields.Schema(id=fields.STORED, text=fields.TEXT(stored=True, vector=True))
-    ix = RamStorage().create_index(schema)
-    w = ix.writer()
-    domain = ("alfa", "bravo", "charlie")
-    count = 1
-    for w1 in domain:
-        for w2 in domain:
-            for w3 in domain:
-                for w4 in domain:
-                    w.add_document(id=count, text=" ".join((w1, w2, w3, w4)))
-                    count += 1
-    w.commit()
+    ix = get_vector_index()
 
     def fn(searcher, docnum):
         v = dict(searcher.vector_as("frequency", docnum, "text"))
@@ -700,7 +714,7 @@ def test_sorting_function():
     with ix.searcher() as s:
         q = query.And([query.Term("text", "alfa"), query.Term("text", "bravo")])
         results = s.search(q, sortedby=fnfacet)
-        r = [hit["text"] for hit in results]
+        r = results.field_column("text")
         for t in r[:10]:
             tks = t.split()
             assert tks.count("alfa") == tks.count("bravo")
@@ -735,7 +749,7 @@ class test_translate:
         # Baseline: just sort by a field
         r = s.search(q, sortedby="a")
         assert (
-            " ".join([hit["name"] for hit in r])
+            " ".join(r.field_column("name"))
             == "charlie bravo echo golf hotel foxtrot delta india alfa"
         )
 
@@ -743,7 +757,7 @@ class test_translate:
         target = [x[0] for x in sorted(domain, key=lambda x: x[0][::-1])]
         tf = sorting.TranslateFacet(lambda name: name[::-1], sorting.FieldFacet("name"))
         r = s.search(q, sortedby=tf)
-        assert [hit["name"] for hit in r] == target
+        assert r.field_column("name") == target
 
         # Sort by average of a and b
         def avg(a, b):
@@ -754,7 +768,7 @@ class test_translate:
         bf = sorting.FieldFacet("b")
         tf = sorting.TranslateFacet(avg, af, bf)
         r = s.search(q, sortedby=tf)
-        assert [hit["name"] for hit in r] == target
+        assert r.field_column("name") == target
 
 
 def test_sorted_groups():
@@ -840,7 +854,7 @@ def test_nocachefield_segments():
         facet = sorting.FieldFacet("a", reverse=True)
 
         r = s.search(q, sortedby=facet)
-        assert [hit["a"] for hit in r] == [
+        assert r.field_column("a") == [
             "juliet",
             "india",
             "foxtrot",
@@ -852,11 +866,11 @@ def test_nocachefield_segments():
         mq = query.Or([query.Term("a", "bravo"), query.Term("a", "delta")])
         anq = query.AndNot(q, mq)
         r = s.search(anq, sortedby=facet)
-        assert [hit["a"] for hit in r] == ["juliet", "india", "foxtrot", "charlie"]
+        assert r.field_column("a") == ["juliet", "india", "foxtrot", "charlie"]
 
         mq = query.Or([query.Term("a", "bravo"), query.Term("a", "delta")])
         r = s.search(q, mask=mq, sortedby=facet)
-        assert [hit["a"] for hit in r] == ["juliet", "india", "foxtrot", "charlie"]
+        assert r.field_column("a") == ["juliet", "india", "foxtrot", "charlie"]
 
         fq = query.Or(
             [
@@ -867,11 +881,11 @@ def test_nocachefield_segments():
             ]
         )
         r = s.search(query.Every(), filter=fq, sortedby=facet)
-        assert [hit["a"] for hit in r] == ["india", "charlie", "alfa"]
+        assert r.field_column("a") == ["india", "charlie", "alfa"]
 
         nq = query.Not(query.Or([query.Term("a", "alfa"), query.Term("a", "india")]))
         r = s.search(query.Every(), filter=nq, sortedby=facet)
-        assert [hit["a"] for hit in r] == [
+        assert r.field_column("a") == [
             "kilo",
             "juliet",
             "foxtrot",
@@ -930,13 +944,13 @@ def test_sort_text_field():
         with ix.searcher() as s:
             # Sort by title
             r = s.search(query.Every(), sortedby="title")
-            titles = [hit["title"] for hit in r]
+            titles = r.field_column("title")
             assert titles == sorted_titles
 
             # Sort by reverse title
             facet = sorting.FieldFacet("title", reverse=True)
             r = s.search(query.Every(), sortedby=facet)
-            assert [hit["title"] for hit in r] == list(reversed(sorted_titles))
+            assert r.field_column("title") == list(reversed(sorted_titles))
 
             # Sort by num (-10 to 10) first, and within that, by reverse title
             facet = sorting.MultiFacet()
@@ -952,7 +966,7 @@ def test_sort_text_field():
                 "Visual Display of Quantitative Information, The",
                 "Envisioning Information",
             ]
-            assert [hit["title"] for hit in r] == target
+            assert r.field_column("title") == target
 
     # Single segment
     with TempIndex(schema) as ix:
@@ -981,9 +995,10 @@ def test_filtered_grouped():
     domain = "alfa bravo charlie delta echo foxtrot".split()
 
     with ix.writer() as w:
-        for i, ls in enumerate(permutations(domain, 3)):
-            tag = str(i % 3)
-            w.add_document(tag=tag, text=" ".join(ls))
+        w.add_documents(
+            {"tag": str(i % 3), "text": " ".join(ls)}
+            for i, ls in enumerate(permutations(domain, 3))
+        )
 
     with ix.searcher() as s:
         f = query.And([query.Term("text", "charlie"), query.Term("text", "delta")])
@@ -1077,10 +1092,28 @@ def test_missing_column():
         assert isinstance(c.categorizer, sorting.ColumnCategorizer)
 
         r = c.results()
-        assert [hit["id"] for hit in r] == [6, 5, 7, 0]
+        assert r.field_column("id") == [6, 5, 7, 0]
 
         r = s.search(q, sortedby="age", reverse=True)
-        assert [hit["id"] for hit in r] == [0, 7, 5, 6]
+        assert r.field_column("id") == [0, 7, 5, 6]
+
+
+def test_lazy_column_categorizer():
+    schema = fields.Schema(tag=fields.ID(sortable=True))
+    ix = RamStorage().create_index(schema)
+    with ix.writer() as w:
+        w.add_document(tag="bravo")
+        w.add_document(tag="alfa")
+
+    with ix.searcher() as s:
+        cat = sorting.FieldFacet("tag").categorizer(s)
+        assert isinstance(cat, sorting.ColumnCategorizer)
+        subsearcher, offset = s.leaf_searchers()[0]
+        cat.set_searcher(subsearcher, offset)
+        # The column isn't opened until a key is needed
+        assert cat._creader is None
+        assert cat.key_for(None, 1) < cat.key_for(None, 0)
+        assert cat._creader is not None
 
 
 def test_compound_sort():
@@ -1160,4 +1193,4 @@ def test_column_scoring():
         with ix.searcher(weighting=MyWeighting()) as s:
             r = s.search(query.Term("tag", "foo"))
             # Note that higher scores are better, so higher letters come first
-            assert [hit["id"] for hit in r] == ["d", "c", "b", "a"]
+            assert r.field_column("id") == ["d", "c", "b", "a"]
@@ -13,24 +13,22 @@ def u(s):
     return s.decode("ascii") if isinstance(s, bytes) else s
 
 
+def sample_texts(count):
+    # Generate the random document texts up front so the writer loops only
+    # have to index them
+    rng = random.Random(0)
+    domain = "alfa bravo charlie delta echo foxtrot golf hotel india".split()
+    return [" ".join(rng.sample(domain, 5)) for _ in range(count)]
+
+
 def test_no_stored():
     schema = fields.Schema(id=fields.ID, text=fields.TEXT)
     with TempIndex(schema, "nostored") as ix:
-        domain = (
-            "alfa",
-            "bravo",
-            "charlie",
-            "delta",
-            "echo",
-            "foxtrot",
-            "golf",
-            "hotel",
-            "india",
-        )
+        texts = sample_texts(20)
 
         w = ix.writer()
         for i in range(20):
-            w.add_document(id=str(i), text=" ".join(random.sample(domain, 5)))
+            w.add_document(id=str(i), text=texts[i])
         w.commit()
 
         with ix.reader() as r:
@@ -40,17 +38,7 @@ def test_no_stored():
 def test_asyncwriter():
     schema = fields.Schema(id=fields.ID(stored=True), text=fields.TEXT)
     with TempIndex(schema, "asyncwriter") as ix:
-        domain = (
-            "alfa",
-            "bravo",
-            "charlie",
-            "delta",
-            "echo",
-            "foxtrot",
-            "golf",
-            "hotel",
-            "india",
-        )
+        texts = sample_texts(20)
 
         writers = []
         # Simulate doing 20 (near-)simultaneous commits. If we weren't using
@@ -59,7 +47,7 @@ def test_asyncwriter():
         for i in range(20):
             w = writing.AsyncWriter(ix)
             writers.append(w)
-            w.add_document(id=str(i), text=" ".join(random.sample(domain, 5)))
+            w.add_document(id=str(i), text=texts[i])
             w.commit()
 
         # Wait for all writers to finish before checking the results
@@ -75,17 +63,7 @@ def test_asyncwriter():
 def test_asyncwriter_no_stored():
     schema = fields.Schema(id=fields.ID, text=fields.TEXT)
     with TempIndex(schema, "asyncnostored") as ix:
-        domain = (
-            "alfa",
-            "bravo",
-            "charlie",
-            "delta",
-            "echo",
-            "foxtrot",
-            "golf",
-            "hotel",
-            "india",
-        )
+        texts = sample_texts(20)
 
         writers = []
         # Simulate doing 20 (near-)simultaneous commits. If we weren't using
@@ -94,7 +72,7 @@ def test_asyncwriter_no_stored():
         for i in range(20):
             w = writing.AsyncWriter(ix)
             writers.append(w)
-            w.add_document(id=str(i), text=" ".join(random.sample(domain, 5)))
+            w.add_document(id=str(i), text=texts[i])
             w.commit()
 
         # Wait for all writers to finish before checking the results
@@ -119,14 +97,13 @@ def test_updates():
 def test_buffered():
     schema = fields.Schema(id=fields.ID, text=fields.TEXT)
     with TempIndex(schema, "buffered") as ix:
-        domain = "alfa bravo charlie delta echo foxtrot golf hotel india"
-        domain = domain.split()
+        texts = sample_texts(20)
 
         w = writing.BufferedWriter(
             ix, period=None, limit=10, commitargs={"merge": False}
         )
         for i in range(20):
-            w.add_document(id=str(i), text=" ".join(random.sample(domain, 5)))
+            w.add_document(id=str(i), text=texts[i])
         time.sleep(0.1)
         w.close()
 
@@ -547,3 +524,21 @@ def test_add_fail_with_absorbed_exception():
         # Assert that correct exception is raised, not the cryptic one
         assert "already" not in ex.value.args[0]
         assert "unicode" in ex.value.args[0]
+
+
+def test_add_documents():
+    schema = fields.Schema(id=fields.ID(stored=True), text=fields.TEXT)
+    ix = RamStorage().create_index(schema)
+    with ix.writer() as w:
+        w.add_documents(
+            [
+                {"id": "a", "text": "alfa bravo"},
+                {"id": "b", "text": "bravo charlie"},
+                {"id": "c", "text": "charlie delta", "_boost": 2.0},
+            ]
+        )
+
+    with ix.searcher() as s:
+        assert s.doc_count() == 3
+        r = s.search(query.Term("text", "bravo"))
+        assert sorted(hit["id"] for hit in r) == ["a", "b"]